@@ -309,12 +309,9 @@ inline void ParentNode::approve_child(const Node* child) const
     // an element is DocumentType
     if (type_id == DOCUMENT_TYPE_NODE)
         throw dom::DOMException(dom::HIERARCHY_REQUEST_ERR, "Bad child type");
-    ARCHON_ASSERT(type_id == ELEMENT_NODE ||
-                  type_id == TEXT_NODE ||
-                  type_id == COMMENT_NODE ||
-                  type_id == PROCESSING_INSTRUCTION_NODE ||
-                  type_id == CDATA_SECTION_NODE ||
-                  type_id == ENTITY_REFERENCE_NODE);
+    ARCHON_ASSERT(1ul<<type_id & (1ul<<ELEMENT_NODE | 1ul<<TEXT_NODE | 1ul<<COMMENT_NODE |
+                                  1ul<<PROCESSING_INSTRUCTION_NODE | 1ul<<CDATA_SECTION_NODE |
+                                  1ul<<ENTITY_REFERENCE_NODE));
 }
 
 
@@ -392,6 +389,8 @@ dom::ref<dom::Node> ChildList::item(dom::uint32 index) const throw ()
         }
 
         n = prev_index - index;
+        if (index < n)
+            goto from_start; // The first child is a nearer anchor
         while (0 < n) {
             --n;
             child = child->get_prev_sibling();
@@ -399,6 +398,7 @@ dom::ref<dom::Node> ChildList::item(dom::uint32 index) const throw ()
         goto done;
     }
 
+  from_start:
     n = index;
     child = parent_node->get_first_child();
 
@@ -1304,43 +1304,35 @@ ElemTypeRef Document::get_elem_type(const dom::DOMString& ns_uri,
                                     const dom::DOMString& tag_name, bool dom1) const
 {
     ElemKey key(ns_uri, tag_name, dom1);
-    ElemType*& type_alias = elem_types[key];
-    ElemType* type = type_alias;
-
-    if (type)
-        return ElemTypeRef(type);
-
-    try {
-        dom::DOMString prefix, local_name;
-        if (dom1) {
-            validate_xml_name(xml_version, tag_name);
+    if (ElemType* const* type = elem_types.find(key))
+        return ElemTypeRef(*type);
+
+    // Validate first, then register, such that a validation failure
+    // never leaves an incomplete entry in the registry.
+    dom::DOMString prefix, local_name;
+    if (dom1) {
+        validate_xml_name(xml_version, tag_name);
+    }
+    else {
+        parse_qualified_name(xml_version, tag_name, prefix, local_name);
+        if (prefix.empty()) {
+            validate_xmlns(impl.get(), ns_uri, local_name);
         }
         else {
-            parse_qualified_name(xml_version, tag_name, prefix, local_name);
-            if (prefix.empty()) {
-                validate_xmlns(impl.get(), ns_uri, local_name);
-            }
-            else {
-                if (!ns_uri.empty())
-                    throw dom::DOMException(dom::NAMESPACE_ERR, "Prefix without namespace URI");
-                if (prefix == impl->str_xml && ns_uri != impl->str_ns_namespace)
-                    throw dom::DOMException(dom::NAMESPACE_ERR, "Namespace must be "
-                                            "'http://www.w3.org/XML/1998/namespace' when the prefix "
-                                            "is 'xml'");
-                validate_xmlns(impl.get(), ns_uri, prefix);
-            }
+            if (!ns_uri.empty())
+                throw dom::DOMException(dom::NAMESPACE_ERR, "Prefix without namespace URI");
+            if (prefix == impl->str_xml && ns_uri != impl->str_ns_namespace)
+                throw dom::DOMException(dom::NAMESPACE_ERR, "Namespace must be "
+                                        "'http://www.w3.org/XML/1998/namespace' when the prefix "
+                                        "is 'xml'");
+            validate_xmlns(impl.get(), ns_uri, prefix);
         }
-
-        bool read_only = false;
-        ElemTypeRef type_ref = create_elem_type(read_only, key, prefix, local_name);
-        type_alias = type_ref.get();
-        return type_ref;
-    }
-    catch (...) {
-        // Remove the incomplete map entry
-        elem_types.erase(key);
-        throw;
     }
+
+    bool read_only = false;
+    ElemTypeRef type_ref = create_elem_type(read_only, key, prefix, local_name);
+    elem_types[key] = type_ref.get();
+    return type_ref;
 }
 
 
@@ -1362,15 +1354,16 @@ ElemTypeRef Document::create_elem_type(bool read_only, const ElemKey& key,
 void Document::parse_qualified_name(XmlVersion v, const dom::DOMString& name,
                                     dom::DOMString& prefix, dom::DOMString& local_name)
 {
-    validate_xml_name(v, name);
-    typedef dom::DOMString::traits_type traits;
-    traits::char_type colon = traits::to_char_type(0x3A);
-    dom::DOMString::size_type i = name.find(colon);
-    if (i == dom::DOMString::npos) {
+    // The validation scan also locates the colon, so the name is
+    // traversed only once.
+    dom::DOMString::size_type i = 0;
+    int num_colons;
+    validate_xml_name(v, name, i, num_colons);
+    if (num_colons == 0) {
         local_name = name;
     }
     else {
-        if (name.find(colon, i+1) != dom::DOMString::npos)
+        if (1 < num_colons)
             throw dom::DOMException(dom::NAMESPACE_ERR, "More than one colon in qualified name");
         prefix     = name.substr(0, i);
         local_name = name.substr(i+1);
@@ -1411,21 +1404,13 @@ Element* Document::create_elem_child_for_parser(ParentNode* parent, const dom::D
     ElemTypeRef type;
     {
         ElemKey key(ns_uri, tag_name, dom1);
-        ElemType*& type2 = elem_types[key];
-        if (type2) {
-            type.reset(type2);
+        if (ElemType* const* type2 = elem_types.find(key)) {
+            type.reset(*type2);
         }
         else {
-            try {
-                bool read_only = false;
-                type = create_elem_type(read_only, key, prefix, local_name);
-                type2 = type.get();
-            }
-            catch (...) {
-                // Remove the incomplete map entry
-                elem_types.erase(key);
-                throw;
-            }
+            bool read_only = false;
+            type = create_elem_type(read_only, key, prefix, local_name);
+            elem_types[key] = type.get();
         }
     }
 
@@ -1518,13 +1503,23 @@ void Document::approve_children(const Node* c, bool only_one) const
 
 
 // Validate the name according the the effective XML version.
-void Document::validate_xml_name(XmlVersion, const dom::DOMString& name)
+void Document::validate_xml_name(XmlVersion v, const dom::DOMString& name)
+{
+    dom::DOMString::size_type colon_pos;
+    int num_colons;
+    validate_xml_name(v, name, colon_pos, num_colons);
+}
+
+
+
+void Document::validate_xml_name(XmlVersion, const dom::DOMString& name,
+                                 dom::DOMString::size_type& colon_pos, int& num_colons)
 {
     if (name.empty())
         throw dom::DOMException(dom::INVALID_CHARACTER_ERR, "No name spacified");
 
     // FIXME: Must use alternative version of validation for XML 1.1
-    if (!validate_xml_1_0_name(name))
+    if (!validate_xml_1_0_name(name, colon_pos, num_colons))
         throw dom::DOMException(dom::INVALID_CHARACTER_ERR, "Bad XML 1.0 name");
 }
 
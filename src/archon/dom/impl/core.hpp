@@ -943,7 +943,7 @@ public:
 
 
 protected:
-    Node(NodeType* t): type(t), parent(0), prev(this), next(0), rare_data(0) {}
+    Node(NodeType* t): prev(this), next(0), parent(0), type(t), rare_data(0) {}
 
 
     /// Overriding method in dom::DOMObject. Must be overriden by
@@ -980,15 +980,18 @@ private:
     friend class Element;
     friend class DocumentType;
 
-    NodeType* type; // May change, but is never null
-
-    // NOTE: For Attr this is the owner element.
-    ParentNode* parent;
+    // The sibling pointers are declared first such that the fields
+    // touched by tree traversal fall at the beginning of the object.
 
     // NOTE: Attr redefines the meaning of 'next' and 'prev'.
     Node* prev; // If first child, this points the the last child
     Node* next; // Null if last child
 
+    // NOTE: For Attr this is the owner element.
+    ParentNode* parent;
+
+    NodeType* type; // May change, but is never null
+
     mutable RareNodeData* rare_data;
 };
 
@@ -1322,6 +1325,11 @@ public:
 
     ElemType* get_type() const throw ();
 
+    // O(1) alternative to probing individual attributes. An element
+    // has specified attributes if, and only if it has an attribute
+    // map.
+    bool has_attributes() const throw () { return attr_map != 0; }
+
     void get_attr_value(const AttrType* t, dom::DOMString& v) const throw ();
 
     void set_attr_value(const AttrType* t, const dom::DOMString& v);
@@ -1439,8 +1447,7 @@ private:
         {
             int n = get_size();
             for (int j = 0; j < n; ++j) {
-                const Slot& s = slots[j];
-                if (s.type != t)
+                if (types[j] != t)
                     continue;
                 i = j;
                 return true;
@@ -1452,6 +1459,11 @@ private:
         {
             Slot& s = slots[i];
             if (!s.attr) {
+                // Setting an already specified attribute to its
+                // current value must have no effect, so skip the copy
+                // in that case.
+                if (get_slot_bits(i) & slot_bit_is_spec && s.value == v)
+                    return;
                 s.value = v;
                 set_slot_bits(i, slot_bit_is_spec);
                 return;
@@ -1478,8 +1490,8 @@ private:
             ARCHON_ASSERT(!full());
             // FIXME: Also assert that the attr type is not already in the map
             int i = get_size();
+            types[i] = t;
             Slot& s = slots[i];
-            s.type = t;
             s.value = v;
             s.attr = 0;
             set_size(i+1);
@@ -1508,10 +1520,13 @@ private:
         }
 
         struct Slot {
-            const AttrType* type;
             dom::DOMString value;
             Attr* attr; // Non-null if external reference is needed or if value is structured or if manipulated such as addition of event handler or user data or node lists
         };
+        // Types are kept in a separate dense array such that find()
+        // scans consecutive pointers rather than striding over the
+        // wider slots.
+        const AttrType* types[max_size];
         Slot slots[max_size];
     };
 
@@ -1542,18 +1557,19 @@ private:
         try {
             Attr* prev_attr = 0;
             for (int i = 0; i < n; ++i) {
+                const AttrType* type = old_map->types[i];
                 const CompactAttrMap::Slot& s = old_map->slots[i];
                 Attr* attr = s.attr;
                 if (attr) {
-                    new_map->map[s.type] = attr;
+                    new_map->map[type] = attr;
                 }
                 else {
                     unsigned slot_bits = old_map->get_slot_bits(i);
                     bool is_spec = slot_bits & CompactAttrMap::slot_bit_is_spec;
                     bool is_id   = slot_bits & CompactAttrMap::slot_bit_is_id;
-                    attr = build_attr(s.type, s.value, is_spec, is_id);
+                    attr = build_attr(type, s.value, is_spec, is_id);
                     core::UniquePtr<Attr> attr_owner(attr);
-                    new_map->map[s.type] = attr;
+                    new_map->map[type] = attr;
                     attr_owner.release();
                 }
                 attr->prev = prev_attr;
@@ -1566,9 +1582,8 @@ private:
         }
         catch (...) {
             for (int i = 0; i < n; ++i) {
-                const CompactAttrMap::Slot& s = old_map->slots[i];
-                if (s.attr)
-                    new_map->map.erase(s.type);
+                if (old_map->slots[i].attr)
+                    new_map->map.erase(old_map->types[i]);
             }
             throw;
         }
@@ -2100,6 +2115,11 @@ private:
     // XML version.
     static void validate_xml_name(XmlVersion v, const dom::DOMString& name);
 
+    // Same validation, but also locate the first colon and count the
+    // colons in the same scan.
+    static void validate_xml_name(XmlVersion v, const dom::DOMString& name,
+                                  dom::DOMString::size_type& colon_pos, int& num_colons);
+
 
     friend class ElemType;
     void unregister_elem_type(ElemType* t)
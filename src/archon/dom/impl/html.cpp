@@ -82,21 +82,22 @@ namespace archon
                                                dom::DOMString const &prefix,
                                                dom::DOMString const &local_name) const
     {
+      HTMLImplementation *const impl = get_impl();
       ElemQual qual;
       qual.tag_name = key.tag_name;
       dom::DOMString html_name;
       bool case_insensitive = false;
-      bool const no_xml = mode != mode_XML && mode != mode_XHTML;
+      bool const no_xml = !is_xml();
       if (key.dom1) {
         bool set_xhtml_ns = false;
-        if (get_impl()->quirk_dom1_api_sets_ns_and_local_name) {
+        if (impl->quirk_dom1_api_sets_ns_and_local_name) {
           if (mode != mode_XML) set_xhtml_ns = true;
           qual.local_name = key.tag_name;
           if (no_xml) to_lower_case_ascii(qual.local_name);
         }
         if (no_xml || set_xhtml_ns) {
           html_name = key.tag_name;
-          qual.ns_uri = get_impl()->str_ns_xhtml;
+          qual.ns_uri = impl->str_ns_xhtml;
           if (no_xml) {
             to_upper_case_ascii(qual.tag_name);
             case_fold_ascii(html_name);
@@ -108,7 +109,7 @@ namespace archon
         qual.ns_uri     = key.ns_uri;
         qual.prefix     = prefix;
         qual.local_name = local_name;
-        bool const is_xhtml_ns = key.ns_uri == get_impl()->str_ns_xhtml;
+        bool const is_xhtml_ns = key.ns_uri == impl->str_ns_xhtml;
         if (no_xml && is_xhtml_ns) to_upper_case_ascii(qual.tag_name);
         if (is_xhtml_ns) html_name = local_name;
       }
@@ -116,8 +117,8 @@ namespace archon
       HTMLDocument *const doc = const_cast<HTMLDocument *>(this);
       if (!html_name.empty()) {
         typedef HTMLImplementation::HtmlElemTypeCtors Ctors;
-        Ctors const &ctors = case_insensitive ? get_impl()->htmlElemTypeCtorsByCfName :
-          get_impl()->htmlElemTypeCtorsByName;
+        Ctors const &ctors = case_insensitive ? impl->htmlElemTypeCtorsByCfName :
+          impl->htmlElemTypeCtorsByName;
         Ctors::const_iterator const i = ctors.find(html_name);
         if (i != ctors.end()) {
           HTMLImplementation::HtmlElemTypeCtor const ctor = i->second;
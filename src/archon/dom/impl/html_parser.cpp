@@ -830,12 +830,13 @@ bool is_space(CharUtf16 c)
     // This is the correct check for HTML 4.01. In XML 1.0 and XML 1.1
     // the same set of characters is used, except they exclude form
     // feed. For SGML in general, it is probably configurable.
+    // The bitmask has a bit set for each of horizontal tab (0x09),
+    // newline (0x0A), form feed (0x0C) (not allowed in XML,) and
+    // carriage return (0x0D), reducing the membership test to a
+    // single shift and mask after the range check.
     TraitsU16::int_type i = TraitsU16::to_int_type(c);
     return i <= 0x20 && (i == 0x20 || // Space
-                         i == 0x0A || // Newline
-                         i == 0x0D || // Carriage return
-                         i == 0x09 || // Horizonatal tab
-                         i == 0x0C);  // Form feed (not allowed in XML)
+                         UIntFast32(1) << i & 0x3600);
 }
 
 
@@ -3809,6 +3810,14 @@ private:
 };
 
 
+// The DTD is static information (the parser only ever consults it
+// through the constant DocTypeDef interface,) so one shared instance
+// serves all parsers. This also means that the entity map is built
+// only once. The instance is constant to guarantee that sharing it
+// between parsers remains safe.
+const HtmlDtd html_dtd;
+
+
 } // anonymous namespace
 
 
@@ -3822,8 +3831,7 @@ namespace html_parser {
 void parse_html(const Source& src, Callbacks& cb, Resolver& resolv, Logger* logger,
                 const Config& config)
 {
-    HtmlDtd dtd;
-    SgmlParser(&dtd, src, cb, resolv, logger, config).parse_sgml();
+    SgmlParser(&html_dtd, src, cb, resolv, logger, config).parse_sgml();
 }
 
 
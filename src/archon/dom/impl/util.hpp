@@ -67,6 +67,17 @@ namespace archon
     bool validate_xml_1_0_name(dom::DOMString const &);
 
 
+    /**
+     * Same check, but additionally locate the first colon and count
+     * the colons in the same pass, saving a rescan when the caller
+     * needs to split a qualified name. The output arguments are
+     * defined only when validation succeeds; when the name contains
+     * no colon, \a colon_pos is left unchanged.
+     */
+    bool validate_xml_1_0_name(dom::DOMString const &, dom::DOMString::size_type &colon_pos,
+                               int &num_colons);
+
+
 
 
     template<class T, int N> struct SmallFixedSizeQueue
@@ -273,43 +284,48 @@ namespace archon
 
 
     inline bool validate_xml_1_0_name(dom::DOMString const &name)
+    {
+      dom::DOMString::size_type colon_pos;
+      int num_colons;
+      return validate_xml_1_0_name(name, colon_pos, num_colons);
+    }
+
+
+
+    inline bool validate_xml_1_0_name(dom::DOMString const &name,
+                                      dom::DOMString::size_type &colon_pos, int &num_colons)
     {
       typedef dom::DOMString::const_iterator iter;
       typedef dom::DOMString::traits_type traits;
       typedef traits::int_type int_type;
+      num_colons = 0;
+      // Classification of the ASCII range: 0 -> not a name character,
+      // 1 -> name character except in first position, 2 -> name
+      // character in any position. A single indexed load replaces the
+      // comparison ladder for the dominant ASCII case.
+      static unsigned char const ascii_name_char_class[0x80] = {
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, // 0x00 - 0x0F
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, // 0x10 - 0x1F
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 0, // 0x20 - 0x2F
+        1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 0, 0, 0, 0, 0, // 0x30 - 0x3F
+        0, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, // 0x40 - 0x4F
+        2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 0, 0, 0, 0, 2, // 0x50 - 0x5F
+        0, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, // 0x60 - 0x6F
+        2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 0, 0, 0, 0, 0  // 0x70 - 0x7F
+      };
       iter const begin = name.begin(), end = name.end();
       for (iter i=begin; i!=end; ++i) {
         int_type const v = traits::to_int_type(*i);
-        if (v < 0xC0) { // 0x0 <= v < 0xC0
-          if (v < 0x5B) { // 0x0 <= v < 0x5B
-            if (v < 0x41) { // 0x0 <= v < 0x41
-              if (v < 0x30) { // 0x0 <= v < 0x30
-                if (v != 0x2D && v != 0x2E) return 0;
-                // '-' or '.'  -->  good unless first char!
-                if (i == begin) return 0;
-              }
-              else if (0x3A <= v) { // 0x3A <= v < 0x41
-                if (v != 0x3A) return 0;
-                // ':'  -->  good!
-              }
-              else { // '0' <= v <= '9'  -->  good unless first char!
-                if (i == begin) return 0;
-              }
-            }
-            else {} // 'A' <= v <= 'Z'  -->  good!
-          }
-          else if (v < 0x7B) { // 0x5B <= v < 0x7B
-            if (v < 0x61) { // 0x5B <= v < 0x61
-              if (v != 0x5F) return 0;
-              // '_'  -->  good!
-            }
-            else {} // 'a' <= v <= 'z'  -->  good!
-          }
-          else { // 0x7B <= v < 0xC0
-            if (v != 0xB7) return 0;
-            // 0xB7  -->  good unless first char!
-            if (i == begin) return 0;
-          }
+        if (v < 0x80) {
+          int const c = ascii_name_char_class[v];
+          if (c == 0) return 0;
+          if (c == 1 && i == begin) return 0;
+          if (v == 0x3A && num_colons++ == 0) colon_pos = i - begin; // ':'
+        }
+        else if (v < 0xC0) { // 0x80 <= v < 0xC0
+          if (v != 0xB7) return 0;
+          // 0xB7  -->  good unless first char!
+          if (i == begin) return 0;
         }
         else if (v <= 0x3000) { // 0xC0 <= v <= 0x3000
           if (v < 0x2000) { // 0xC0 <= v < 0x2000
@@ -59,26 +59,31 @@ namespace
   wstring const ind_step = Text::widen_port<wchar_t>("  ", locale());
 
 
-  void dump(dom::ref<dom::Node> const &n, wstring ind)
+  void dump(dom::ref<dom::Node> const &n, wstring const &ind)
   {
-    if (dom::DocumentType *doctype = dynamic_cast<dom::DocumentType *>(n.get())) {
+    // Branch on the numeric node type first, such that the common node
+    // types bypass the dynamic cast entirely.
+    if (n->getNodeType() == dom::Node::DOCUMENT_TYPE_NODE) {
+      dom::ref<dom::DocumentType> doctype = dynamic_pointer_cast<dom::DocumentType>(n);
 
       wcout << ind << "Doctype: " << fmt(doctype->getName()) << "\n";
       wcout << ind << "  Public ID = " << fmt(doctype->getPublicId()) << "\n";
       wcout << ind << "  System ID = " << fmt(doctype->getSystemId()) << "\n";
 
+      wstring const ind2 = ind + ind_step + ind_step;
+
       wcout << ind << "  Entities:\n";
       dom::ref<dom::NamedNodeMap> entities = doctype->getEntities();
       for (dom::uint32 i=0; i<entities->getLength(); ++i) {
         dom::ref<dom::Entity> e = dynamic_pointer_cast<dom::Entity>(entities->item(i));
-        dump(e, ind + ind_step + ind_step);
+        dump(e, ind2);
       }
 
       wcout << ind << "  Notations:\n";
       dom::ref<dom::NamedNodeMap> notations = doctype->getNotations();
       for (dom::uint32 i=0; i<notations->getLength(); ++i) {
         dom::ref<dom::Notation> e = dynamic_pointer_cast<dom::Notation>(notations->item(i));
-        dump(e, ind + ind_step + ind_step);
+        dump(e, ind2);
       }
 
       wcout << ind << "  Internal subset = " << fmt(doctype->getInternalSubset()) << "\n";
@@ -102,9 +107,13 @@ namespace
 //       }
 //     }
     dom::ref<dom::Node> c = n->getFirstChild();
-    while (c) {
-      dump(c, ind + ind_step);
-      c = c->getNextSibling();
+    if (c) {
+      wstring const ind2 = ind + ind_step;
+      do {
+        dump(c, ind2);
+        c = c->getNextSibling();
+      }
+      while (c);
     }
   }
 }
@@ -132,6 +132,15 @@ namespace archon
 
       V &operator[](K const &key);
 
+      /**
+       * Get a pointer to the value stored for the specified key, or
+       * null if there is no entry for that key. In contrast to the
+       * subscript operator, this method never inserts an entry.
+       */
+      V *find(K const &key);
+
+      V const *find(K const &key) const;
+
       bool empty() const throw() { return num_entries == 0; }
 
       std::size_t size() const throw() { return num_entries; }
@@ -265,6 +274,34 @@ namespace archon
     }
 
 
+    template<class K, class V, class H, class P>
+    inline V *HashMap<K,V,H,P>::find(K const &key)
+    {
+      std::size_t n = buckets.size();
+      if(0 < n)
+      {
+        typename Buckets::iterator const bucket = buckets.begin() + H::hash(key, n);
+        Entry *const last = bucket->last;
+        if (last) {
+          Entry *e = bucket->first;
+          for (;;) {
+            if (e->v.first == key) return &e->v.second;
+            if (e == last) break;
+            e = e->next;
+          }
+        }
+      }
+      return 0;
+    }
+
+
+    template<class K, class V, class H, class P>
+    inline V const *HashMap<K,V,H,P>::find(K const &key) const
+    {
+      return const_cast<HashMap *>(this)->find(key);
+    }
+
+
     template<class K, class V, class H, class P>
     inline std::size_t HashMap<K,V,H,P>::bucket_size(std::size_t i) const
     {